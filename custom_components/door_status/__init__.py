@@ -2,72 +2,73 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback, Event
-from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers import config_validation as cv
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 
-from .const import DOMAIN
+from .const import DOMAIN, PLATFORMS, SERVICE_RELOAD, ATTR_ENTRY_ID
+from .migrations import async_migrate_entry  # noqa: F401
+from .models import DomainData, DoorStatusConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+RELOAD_SERVICE_SCHEMA = vol.Schema({vol.Required(ATTR_ENTRY_ID): str})
+
+async def _async_reload_service(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Reload a Door Status config entry."""
+    await hass.config_entries.async_reload(call.data[ATTR_ENTRY_ID])
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Door Status component."""
-    # Register recorder exclusion filter
-    if not hass.data.get(DOMAIN):
-        hass.data[DOMAIN] = {}
-        
-        @callback
-        def _exclude_door_status_entities(event: Event) -> None:
-            """Exclude door status entities from recorder."""
-            if event.data.get("action") == "entity_registry_updated":
-                entity_id = event.data["entity_id"]
-                if entity_id.startswith(f"sensor.{DOMAIN}_"):
-                    hass.data[DOMAIN][entity_id] = True
-                    async_dispatcher_send(
-                        hass,
-                        "exclude_entity_from_recorder",
-                        entity_id,
-                        True
-                    )
+    hass.data.setdefault(DOMAIN, DomainData())
 
-        hass.bus.async_listen("entity_registry_updated", _exclude_door_status_entities)
+    # Setup reload service, shared by all config entries
+    if not hass.services.has_service(DOMAIN, SERVICE_RELOAD):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_RELOAD,
+            partial(_async_reload_service, hass),
+            schema=RELOAD_SERVICE_SCHEMA
+        )
 
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Door Status from a config entry."""
-    async def _check_camera_available(_event=None):
-        if hass.states.get("camera.gvrata1") is None or \
-           hass.states.get("camera.gvrata1").state == "unavailable":
+    config = DoorStatusConfig.from_entry(entry)
+    hass.data[DOMAIN].entries[entry.entry_id] = config
+    camera_entity = config.camera_entity
+
+    @callback
+    def _check_camera_available(_event=None):
+        state = hass.states.get(camera_entity)
+        if state is None or state.state == "unavailable":
             _LOGGER.warning("Camera still unavailable during startup")
-        else:
-            _LOGGER.info("Camera became available, updating Door Status sensor")
-            await hass.config_entries.async_reload(entry.entry_id)
+            return
+        _LOGGER.info("Camera became available, updating Door Status sensor")
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
 
     hass.bus.async_listen_once("homeassistant_started", _check_camera_available)
 
     # ✅ Forward the setup to the sensor platform using the new API
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
-
-    # Setup reload service
-    async def async_reload_config_entry(call):
-        """Reload Door Status config entry."""
-        await hass.config_entries.async_reload(entry.entry_id)
-
-    hass.services.async_register(
-        DOMAIN,
-        f"reload_{entry.entry_id}",
-        async_reload_config_entry
-    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, ["sensor"])
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        domain_data = hass.data[DOMAIN]
+        config = domain_data.entries.pop(entry.entry_id, None)
+        # Drop the cached frame once no remaining entry watches the camera
+        if config is not None and not any(
+            other.camera_entity == config.camera_entity
+            for other in domain_data.entries.values()
+        ):
+            domain_data.images.pop(config.camera_entity, None)
+    return unload_ok
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
@@ -4,7 +4,6 @@ from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN,
@@ -31,18 +30,91 @@ from .const import (
     DEFAULT_STATE_TIMEOUT
 )
 
-def color_tuple(value: str) -> tuple[int, int, int]:
-    """Convert color string to tuple."""
+def _int_parts(value: str | list[int], count: int, message: str) -> tuple[int, ...]:
+    """Split 'a,b,...' into exactly `count` ints; parsed sequences pass through."""
+    if isinstance(value, (list, tuple)):
+        if len(value) != count:
+            raise vol.Invalid(message)
+        return tuple(value)
+    parts = value.split(',')
+    if len(parts) != count:
+        raise vol.Invalid(message)
     try:
-        r, g, b = map(int, value.split(','))
-        return (r, g, b)
+        return tuple(int(part) for part in parts)
     except ValueError:
-        raise vol.Invalid("Color must be in format 'R,G,B'")
+        raise vol.Invalid(message)
+
+def color_tuple(value: str | list[int]) -> tuple[int, int, int]:
+    """Convert color string to tuple."""
+    return _int_parts(value, 3, "Color must be in format 'R,G,B'")
+
+def coordinate_tuple(value: str | list[int]) -> tuple[int, int]:
+    """Convert coordinate string to tuple."""
+    return _int_parts(value, 2, "Coordinates must be in format 'X,Y'")
+
+def as_text(value: str | list[int]) -> str:
+    """Render a stored coordinate/color as the 'a,b,c' form value."""
+    if isinstance(value, (list, tuple)):
+        return ",".join(map(str, value))
+    return value
+
+# Text fields stored as parsed int lists, with their parsers
+_PARSED_FIELDS = (
+    (CONF_POINT_A, coordinate_tuple),
+    (CONF_POINT_B, coordinate_tuple),
+    (CONF_MIN_COLOR, color_tuple),
+    (CONF_MAX_COLOR, color_tuple),
+)
+
+def normalize_input(user_input: dict) -> dict:
+    """Parse coordinate and color strings into JSON-serializable int lists."""
+    normalized = {**user_input}
+    for key, parser in _PARSED_FIELDS:
+        if key in normalized:
+            normalized[key] = list(parser(normalized[key]))
+    return normalized
+
+_OPTIONS_FIELDS = {
+    vol.Required(CONF_POINT_A, default="0,0"): str,
+    vol.Required(CONF_POINT_B, default="100,100"): str,
+    vol.Required(CONF_MIN_COLOR, default="0,0,0"): str,
+    vol.Required(CONF_MAX_COLOR, default="255,255,255"): str,
+    vol.Required(CONF_IDLE_INTERVAL, default=DEFAULT_IDLE_INTERVAL): int,
+    vol.Required(CONF_ACTIVE_INTERVAL, default=DEFAULT_ACTIVE_INTERVAL): int,
+    vol.Required(CONF_CHANGE_THRESHOLD, default=DEFAULT_CHANGE_THRESHOLD): int,
+    vol.Required(CONF_CLOSED_POSITION, default=DEFAULT_CLOSED_POSITION): int,
+    vol.Required(CONF_OPEN_POSITION, default=DEFAULT_OPEN_POSITION): int,
+    vol.Required(CONF_TRANSITION_THRESHOLD, default=DEFAULT_TRANSITION_THRESHOLD): int,
+    vol.Required(CONF_STATE_TIMEOUT, default=DEFAULT_STATE_TIMEOUT): int,
+}
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_CAMERA_ENTITY): str,
+    **_OPTIONS_FIELDS,
+})
+
+_OPTIONS_SCHEMA = vol.Schema(_OPTIONS_FIELDS)
+
+# Keys persisted in the config entry data
+_CONF_KEYS = (
+    CONF_CAMERA_ENTITY,
+    CONF_POINT_A,
+    CONF_POINT_B,
+    CONF_MIN_COLOR,
+    CONF_MAX_COLOR,
+    CONF_IDLE_INTERVAL,
+    CONF_ACTIVE_INTERVAL,
+    CONF_CHANGE_THRESHOLD,
+    CONF_CLOSED_POSITION,
+    CONF_OPEN_POSITION,
+    CONF_TRANSITION_THRESHOLD,
+    CONF_STATE_TIMEOUT,
+)
 
 class DoorStatusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Door Status."""
 
-    VERSION = 2
+    VERSION = 3
     MINOR_VERSION = 1
 
     async def async_step_user(self, user_input=None):
@@ -55,52 +127,21 @@ class DoorStatusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not camera_state or camera_state.domain != "camera":
                 errors[CONF_CAMERA_ENTITY] = "invalid_camera"
             
-            # Validate coordinates
+            # Validate coordinates and colors
             try:
-                point_a = tuple(map(int, user_input[CONF_POINT_A].split(',')))
-                point_b = tuple(map(int, user_input[CONF_POINT_B].split(',')))
-                if len(point_a) != 2 or len(point_b) != 2:
-                    errors["base"] = "invalid_coordinates"
-            except ValueError:
+                user_input = normalize_input(user_input)
+            except vol.Invalid:
                 errors["base"] = "invalid_coordinates"
                 
             if not errors:
                 return self.async_create_entry(
                     title=f"Door Status {user_input[CONF_CAMERA_ENTITY]}",
-                    data={
-                        CONF_CAMERA_ENTITY: user_input[CONF_CAMERA_ENTITY],
-                        CONF_POINT_A: user_input[CONF_POINT_A],
-                        CONF_POINT_B: user_input[CONF_POINT_B],
-                        CONF_MIN_COLOR: user_input[CONF_MIN_COLOR],
-                        CONF_MAX_COLOR: user_input[CONF_MAX_COLOR],
-                        CONF_IDLE_INTERVAL: user_input[CONF_IDLE_INTERVAL],
-                        CONF_ACTIVE_INTERVAL: user_input[CONF_ACTIVE_INTERVAL],
-                        CONF_CHANGE_THRESHOLD: user_input[CONF_CHANGE_THRESHOLD],
-                        CONF_CLOSED_POSITION: user_input[CONF_CLOSED_POSITION],
-                        CONF_OPEN_POSITION: user_input[CONF_OPEN_POSITION],
-                        CONF_TRANSITION_THRESHOLD: user_input[CONF_TRANSITION_THRESHOLD],
-                        CONF_STATE_TIMEOUT: user_input[CONF_STATE_TIMEOUT]
-                    },
+                    data={key: user_input[key] for key in _CONF_KEYS},
                 )
 
-        data_schema = vol.Schema({
-            vol.Required(CONF_CAMERA_ENTITY): str,
-            vol.Required(CONF_POINT_A, default="0,0"): str,
-            vol.Required(CONF_POINT_B, default="100,100"): str,
-            vol.Required(CONF_MIN_COLOR, default="0,0,0"): str,
-            vol.Required(CONF_MAX_COLOR, default="255,255,255"): str,
-            vol.Required(CONF_IDLE_INTERVAL, default=DEFAULT_IDLE_INTERVAL): int,
-            vol.Required(CONF_ACTIVE_INTERVAL, default=DEFAULT_ACTIVE_INTERVAL): int,
-            vol.Required(CONF_CHANGE_THRESHOLD, default=DEFAULT_CHANGE_THRESHOLD): int,
-            vol.Required(CONF_CLOSED_POSITION, default=DEFAULT_CLOSED_POSITION): int,
-            vol.Required(CONF_OPEN_POSITION, default=DEFAULT_OPEN_POSITION): int,
-            vol.Required(CONF_TRANSITION_THRESHOLD, default=DEFAULT_TRANSITION_THRESHOLD): int,
-            vol.Required(CONF_STATE_TIMEOUT, default=DEFAULT_STATE_TIMEOUT): int,
-        })
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -119,12 +160,27 @@ class DoorStatusOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
+        errors = {}
+
         if user_input is not None:
+            try:
+                user_input = normalize_input(user_input)
+            except vol.Invalid:
+                errors["base"] = "invalid_coordinates"
+
+        if user_input is not None and not errors:
+            entry_data = self.config_entry.data
+            options = self.config_entry.options
+            current = {**entry_data, **options}
+            if all(current.get(key) == value for key, value in user_input.items()):
+                # Keep the stored options as they are, so the entry isn't
+                # written and the sensor isn't refreshed
+                return self.async_create_entry(title="", data=dict(options))
+
             # Update both options and data to ensure immediate effect
-            new_data = {**self.config_entry.data, **user_input}
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
-                data=new_data,
+                data={**entry_data, **user_input},
                 options=user_input
             )
             return self.async_create_entry(title="", data=user_input)
@@ -132,53 +188,10 @@ class DoorStatusOptionsFlowHandler(config_entries.OptionsFlow):
         # Get current options or use defaults from config entry data
         options = self.config_entry.options or {}
         data = {**self.config_entry.data, **options}
+        suggested = {key: as_text(value) for key, value in data.items()}
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_POINT_A,
-                    default=data.get(CONF_POINT_A, "0,0")
-                ): str,
-                vol.Required(
-                    CONF_POINT_B,
-                    default=data.get(CONF_POINT_B, "100,100")
-                ): str,
-                vol.Required(
-                    CONF_MIN_COLOR,
-                    default=data.get(CONF_MIN_COLOR, "0,0,0")
-                ): str,
-                vol.Required(
-                    CONF_MAX_COLOR,
-                    default=data.get(CONF_MAX_COLOR, "255,255,255")
-                ): str,
-                vol.Required(
-                    CONF_IDLE_INTERVAL,
-                    default=data.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
-                ): int,
-                vol.Required(
-                    CONF_ACTIVE_INTERVAL,
-                    default=data.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL)
-                ): int,
-                vol.Required(
-                    CONF_CHANGE_THRESHOLD,
-                    default=data.get(CONF_CHANGE_THRESHOLD, DEFAULT_CHANGE_THRESHOLD)
-                ): int,
-                vol.Required(
-                    CONF_CLOSED_POSITION,
-                    default=data.get(CONF_CLOSED_POSITION, DEFAULT_CLOSED_POSITION)
-                ): int,
-                vol.Required(
-                    CONF_OPEN_POSITION,
-                    default=data.get(CONF_OPEN_POSITION, DEFAULT_OPEN_POSITION)
-                ): int,
-                vol.Required(
-                    CONF_TRANSITION_THRESHOLD,
-                    default=data.get(CONF_TRANSITION_THRESHOLD, DEFAULT_TRANSITION_THRESHOLD)
-                ): int,
-                vol.Required(
-                    CONF_STATE_TIMEOUT,
-                    default=data.get(CONF_STATE_TIMEOUT, DEFAULT_STATE_TIMEOUT)
-                ): int,
-            }),
+            data_schema=self.add_suggested_values_to_schema(_OPTIONS_SCHEMA, suggested),
+            errors=errors,
         )
\ No newline at end of file
@@ -3,8 +3,13 @@ from datetime import timedelta
 from typing import Final
 
 DOMAIN: Final = "door_status"
+PLATFORMS: Final = ("sensor",)
 EVENT_DOOR_STATUS_UPDATED: Final = "door_status_updated"
 
+# Services
+SERVICE_RELOAD: Final = "reload"
+ATTR_ENTRY_ID: Final = "entry_id"
+
 # Default values
 DEFAULT_MIN_COLOR: Final = (0, 0, 0)  # Black
 DEFAULT_MAX_COLOR: Final = (255, 255, 255)  # White
@@ -2,24 +2,67 @@
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+from .const import (
+    CONF_POINT_A,
+    CONF_POINT_B,
+    CONF_MIN_COLOR,
+    CONF_MAX_COLOR,
+    CONF_IDLE_INTERVAL,
+    CONF_ACTIVE_INTERVAL,
+    CONF_CHANGE_THRESHOLD,
+    CONF_CLOSED_POSITION,
+    CONF_OPEN_POSITION,
+    CONF_TRANSITION_THRESHOLD,
+    CONF_STATE_TIMEOUT,
+)
+
+_PARSED_KEYS = (CONF_POINT_A, CONF_POINT_B, CONF_MIN_COLOR, CONF_MAX_COLOR)
+
+# Defaults for fields introduced in version 2
+_V2_DEFAULTS = {
+    CONF_MIN_COLOR: [0, 0, 0],
+    CONF_MAX_COLOR: [255, 255, 255],
+    CONF_IDLE_INTERVAL: 10,
+    CONF_ACTIVE_INTERVAL: 1,
+    CONF_CHANGE_THRESHOLD: 10,
+    CONF_CLOSED_POSITION: 90,
+    CONF_OPEN_POSITION: 10,
+    CONF_TRANSITION_THRESHOLD: 5,
+    CONF_STATE_TIMEOUT: 5,
+}
+
+def _parse_legacy(values: dict) -> dict:
+    """Convert 'a,b,c' strings stored by older versions into int lists."""
+    return {
+        key: [int(part) for part in value.split(',')]
+        for key, value in values.items()
+        if key in _PARSED_KEYS and isinstance(value, str)
+    }
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Migrate old entry."""
+    if config_entry.version > 3:
+        # Entry was written by a newer version of the integration
+        return False
+
     if config_entry.version == 1:
-        # Migration from version 1 to 2
-        new_data = {**config_entry.data}
-        
-        # Add default values for new fields if missing
-        new_data.setdefault(CONF_MIN_COLOR, "0,0,0")
-        new_data.setdefault(CONF_MAX_COLOR, "255,255,255")
-        new_data.setdefault(CONF_IDLE_INTERVAL, 10)
-        new_data.setdefault(CONF_ACTIVE_INTERVAL, 1)
-        new_data.setdefault(CONF_CHANGE_THRESHOLD, 10)
-        new_data.setdefault(CONF_CLOSED_POSITION, 90)
-        new_data.setdefault(CONF_OPEN_POSITION, 10)
-        new_data.setdefault(CONF_TRANSITION_THRESHOLD, 5)
-        new_data.setdefault(CONF_STATE_TIMEOUT, 5)
-        
-        config_entry.version = 2
-        hass.config_entries.async_update_entry(config_entry, data=new_data)
+        # Migration from version 1 to 2; existing values win over defaults
+        new_data = {**_V2_DEFAULTS, **config_entry.data}
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data=new_data,
+            version=2
+        )
+
+    if config_entry.version == 2:
+        # Migration from version 2 to 3: store coordinates and colors
+        # pre-parsed. Older releases can't read these, hence the major bump
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={**config_entry.data, **_parse_legacy(config_entry.data)},
+            options={**config_entry.options, **_parse_legacy(config_entry.options)},
+            version=3,
+            minor_version=1
+        )
         
-    return True
\ No newline at end of file
+    return True
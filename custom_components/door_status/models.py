@@ -0,0 +1,84 @@
+"""Data models for the Door Status integration."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    CONF_CAMERA_ENTITY,
+    CONF_POINT_A,
+    CONF_POINT_B,
+    CONF_MIN_COLOR,
+    CONF_MAX_COLOR,
+    CONF_IDLE_INTERVAL,
+    CONF_ACTIVE_INTERVAL,
+    CONF_CHANGE_THRESHOLD,
+    CONF_CLOSED_POSITION,
+    CONF_OPEN_POSITION,
+    CONF_TRANSITION_THRESHOLD,
+    CONF_STATE_TIMEOUT,
+    DEFAULT_MIN_COLOR,
+    DEFAULT_MAX_COLOR,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_CHANGE_THRESHOLD,
+    DEFAULT_CLOSED_POSITION,
+    DEFAULT_OPEN_POSITION,
+    DEFAULT_TRANSITION_THRESHOLD,
+    DEFAULT_STATE_TIMEOUT
+)
+
+if TYPE_CHECKING:
+    from homeassistant.components.camera import Image
+
+@dataclass(frozen=True)
+class DoorStatusConfig:
+    """Parsed configuration of a Door Status config entry."""
+
+    camera_entity: str
+    point_a: tuple[int, int]
+    point_b: tuple[int, int]
+    min_color: tuple[int, int, int]
+    max_color: tuple[int, int, int]
+    idle_interval: int
+    active_interval: int
+    change_threshold: int
+    closed_position: int
+    open_position: int
+    transition_threshold: int
+    state_timeout: int
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> DoorStatusConfig:
+        """Build the config from entry data, with options taking precedence.
+
+        Coordinates and colors are stored as validated int lists since
+        config version 3; the migration converts older string values.
+        """
+        data = {**entry.data, **entry.options}
+        return cls(
+            camera_entity=data[CONF_CAMERA_ENTITY],
+            point_a=tuple(data.get(CONF_POINT_A, (0, 0))),
+            point_b=tuple(data.get(CONF_POINT_B, (100, 100))),
+            min_color=tuple(data.get(CONF_MIN_COLOR, DEFAULT_MIN_COLOR)),
+            max_color=tuple(data.get(CONF_MAX_COLOR, DEFAULT_MAX_COLOR)),
+            idle_interval=data.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+            active_interval=data.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+            change_threshold=data.get(CONF_CHANGE_THRESHOLD, DEFAULT_CHANGE_THRESHOLD),
+            closed_position=data.get(CONF_CLOSED_POSITION, DEFAULT_CLOSED_POSITION),
+            open_position=data.get(CONF_OPEN_POSITION, DEFAULT_OPEN_POSITION),
+            transition_threshold=data.get(CONF_TRANSITION_THRESHOLD, DEFAULT_TRANSITION_THRESHOLD),
+            state_timeout=data.get(CONF_STATE_TIMEOUT, DEFAULT_STATE_TIMEOUT),
+        )
+
+@dataclass(slots=True)
+class DomainData:
+    """Runtime data shared by all Door Status config entries."""
+
+    entries: dict[str, DoorStatusConfig] = field(default_factory=dict)
+    # Latest (monotonic timestamp, image) per camera, shared between sensors,
+    # or the fetch task while one is in flight
+    images: dict[str, tuple[float, Image] | asyncio.Task[Image]] = field(default_factory=dict)
@@ -1,20 +1,24 @@
 """Sensor platform for Door Status."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import numpy as np
 from PIL import Image
 import io
-import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
 from typing import Any
 
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.camera import async_get_image
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.event import async_track_time_interval
@@ -24,17 +28,6 @@ from .const import (
     DOMAIN,
     EVENT_DOOR_STATUS_UPDATED,
     CONF_CAMERA_ENTITY,
-    CONF_POINT_A,
-    CONF_POINT_B,
-    CONF_MIN_COLOR,
-    CONF_MAX_COLOR,
-    CONF_IDLE_INTERVAL,
-    CONF_ACTIVE_INTERVAL,
-    CONF_CHANGE_THRESHOLD,
-    CONF_CLOSED_POSITION,
-    CONF_OPEN_POSITION,
-    CONF_TRANSITION_THRESHOLD,
-    CONF_STATE_TIMEOUT,
     STATE_OPEN,
     STATE_CLOSED,
     STATE_OPENING,
@@ -43,20 +36,119 @@ from .const import (
     STATE_UNKNOWN,
     NEXT_ACTION_OPEN,
     NEXT_ACTION_CLOSE,
-    NEXT_ACTION_UNKNOWN,
-    DEFAULT_MIN_COLOR,
-    DEFAULT_MAX_COLOR,
-    DEFAULT_IDLE_INTERVAL,
-    DEFAULT_ACTIVE_INTERVAL,
-    DEFAULT_CHANGE_THRESHOLD,
-    DEFAULT_CLOSED_POSITION,
-    DEFAULT_OPEN_POSITION,
-    DEFAULT_TRANSITION_THRESHOLD,
-    DEFAULT_STATE_TIMEOUT
+    NEXT_ACTION_UNKNOWN
 )
+from .models import DoorStatusConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum spacing of state writes while the door state flaps, in seconds
+_MIN_STATE_WRITE_INTERVAL = 0.25
+
+def _line_sampler(
+    point_a: tuple[int, int], point_b: tuple[int, int], width: int, height: int
+) -> Callable[[Image.Image], Image.Image]:
+    """Return a function extracting the pixels of line A-B from a frame as a strip."""
+    x0, y0 = point_a
+    x1, y1 = point_b
+
+    x0 = max(0, min(x0, width - 1))
+    y0 = max(0, min(y0, height - 1))
+    x1 = max(0, min(x1, width - 1))
+    y1 = max(0, min(y1, height - 1))
+
+    # Door edges are usually vertical or horizontal; those lines are an
+    # exact one pixel wide crop
+    if x0 == x1 or y0 == y1:
+        box = (min(x0, x1), min(y0, y1), max(x0, x1) + 1, max(y0, y1) + 1)
+        return partial(Image.Image.crop, box=box)
+
+    # One sample per step along the major axis. Output pixel i (center
+    # i + 0.5) lands on the center of the input pixel at x0 + i * step, so
+    # with the clamped endpoints every sample lies inside the image.
+    # This is not Bresenham: PIL steps in fixed point and rounds ties the
+    # other way, so lines with slope 1/2 or 1/4 can pick a neighbouring
+    # pixel for up to half their samples.
+    n = max(abs(x1 - x0), abs(y1 - y0)) + 1
+    span = n - 1
+    step_x = (x1 - x0) / span
+    step_y = (y1 - y0) / span
+    matrix = (
+        step_x, 0.0, x0 + 0.5 - step_x * 0.5,
+        step_y, 0.0, y0 + 0.5 - step_y * 0.5,
+    )
+    return partial(
+        Image.Image.transform,
+        size=(n, 1),
+        method=Image.AFFINE,
+        data=matrix,
+        resample=Image.NEAREST
+    )
+
+def _count_in_range(pixels: np.ndarray, lower: np.ndarray, span: np.ndarray | None) -> int:
+    """Count pixels whose channels all lie within [lower, lower + span]."""
+    if span is None:
+        return 0
+    # uint8 subtraction wraps values below `lower` past `span`, so a single
+    # compare checks both bounds of the range at once
+    return int(np.count_nonzero(((pixels - lower) <= span).all(axis=1)))
+
+def _make_classifier(
+    open_position: float,
+    closed_position: float,
+    transition_threshold: float,
+    change_threshold: float
+):
+    """Build a door state classifier with the thresholds baked in."""
+    open_limit = open_position + transition_threshold
+    closed_limit = closed_position - transition_threshold
+    midpoint = (closed_position + open_position) / 2
+
+    def classify(percent: float, last_percent: float | None) -> tuple[str, str]:
+        """Return (door_state, next_action) for a percentage reading."""
+        if percent <= open_limit:
+            return STATE_OPEN, NEXT_ACTION_CLOSE
+        if percent >= closed_limit:
+            return STATE_CLOSED, NEXT_ACTION_OPEN
+        change = percent - (last_percent or percent)
+        if abs(change) >= change_threshold:
+            if change > 0:
+                return STATE_CLOSING, NEXT_ACTION_OPEN
+            return STATE_OPENING, NEXT_ACTION_CLOSE
+        if percent > open_limit:
+            if percent > midpoint:
+                return STATE_PARTIALLY_OPEN, NEXT_ACTION_OPEN
+            return STATE_PARTIALLY_OPEN, NEXT_ACTION_CLOSE
+        return STATE_UNKNOWN, NEXT_ACTION_UNKNOWN
+
+    return classify
+
+def _store_fetched_image(images: dict, camera_entity: str, task: asyncio.Task) -> None:
+    """Replace a finished fetch task with its timestamped image, or drop it on failure."""
+    if images.get(camera_entity) is not task:
+        # Evicted (e.g. entry unloaded) while the fetch was in flight
+        return
+    if task.cancelled() or task.exception() is not None:
+        del images[camera_entity]
+    else:
+        images[camera_entity] = (time.monotonic(), task.result())
+
+async def _async_get_shared_image(hass: HomeAssistant, camera_entity: str, ttl: float):
+    """Get a camera image, reusing one fetched for the same camera within `ttl` seconds."""
+    images = hass.data[DOMAIN].images
+    cached = images.get(camera_entity)
+    if isinstance(cached, asyncio.Task):
+        # Sensors on one camera tick together; join the fetch in flight
+        return await asyncio.shield(cached)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    # Get camera image; the camera component enforces the timeout
+    task = hass.async_create_task(async_get_image(hass, camera_entity, timeout=10))
+    images[camera_entity] = task
+    task.add_done_callback(partial(_store_fetched_image, images, camera_entity))
+    return await asyncio.shield(task)
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
     """Set up the sensor platform."""
     sensor = DoorStatusSensor(hass, config_entry)
@@ -70,6 +162,17 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
     _attr_icon = "mdi:door"
+    # Static configuration echoed in attributes; keep it out of the recorder
+    _unrecorded_attributes = frozenset({
+        "min_color",
+        "max_color",
+        "point_a",
+        "point_b",
+        "closed_position",
+        "open_position",
+        "transition_threshold",
+        "state_timeout",
+    })
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
         """Initialize the sensor."""
@@ -80,6 +183,7 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
         )
         
         # Initialize config parameters
+        self._raw_config = {**config_entry.data, **config_entry.options}
         self._update_config_from_entry()
         
         # Initialize state variables
@@ -90,10 +194,15 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
         self._last_update_time = dt_util.utcnow()
         self._state_stable_since = dt_util.utcnow()
         self._unsub_update = None
+        self._unsub_state_write = None
+        self._last_state_write = 0.0
+        self._pending_event = False
         self._active_mode = False
-        self._state_history = []
         self._max_history_length = 20
+        self._state_history = deque(maxlen=self._max_history_length)
         self._available = False
+        self._line_geometry = None
+        self._last_frame = None
         
         # Device and entity setup
         self._attr_name = "Status"
@@ -106,52 +215,104 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
 
     def _update_config_from_entry(self):
         """Update all config parameters from config entry."""
-        config_data = {**self._config_entry.data, **self._config_entry.options}
+        # Entry setup already parsed the config; only reparse when the
+        # stored values changed since
+        entries = self._hass.data[DOMAIN].entries
+        entry_id = self._config_entry.entry_id
+        raw_config = {**self._config_entry.data, **self._config_entry.options}
+        if raw_config != self._raw_config:
+            self._raw_config = raw_config
+            entries[entry_id] = DoorStatusConfig.from_entry(self._config_entry)
+        config = entries[entry_id]
         
-        self._camera_entity = config_data[CONF_CAMERA_ENTITY]
-        self._point_a = self._parse_coordinates(config_data.get(CONF_POINT_A, "0,0"))
-        self._point_b = self._parse_coordinates(config_data.get(CONF_POINT_B, "100,100"))
-        self._min_color = self._parse_color(config_data.get(CONF_MIN_COLOR, "0,0,0"))
-        self._max_color = self._parse_color(config_data.get(CONF_MAX_COLOR, "255,255,255"))
-        self._idle_interval = config_data.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
-        self._active_interval = config_data.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL)
-        self._change_threshold = config_data.get(CONF_CHANGE_THRESHOLD, DEFAULT_CHANGE_THRESHOLD)
-        self._closed_position = config_data.get(CONF_CLOSED_POSITION, DEFAULT_CLOSED_POSITION)
-        self._open_position = config_data.get(CONF_OPEN_POSITION, DEFAULT_OPEN_POSITION)
-        self._transition_threshold = config_data.get(CONF_TRANSITION_THRESHOLD, DEFAULT_TRANSITION_THRESHOLD)
-        self._state_timeout = config_data.get(CONF_STATE_TIMEOUT, DEFAULT_STATE_TIMEOUT)
+        self._camera_entity = config.camera_entity
+        self._point_a = config.point_a
+        self._point_b = config.point_b
+        self._min_color = config.min_color
+        self._max_color = config.max_color
+        self._update_color_bounds()
+        self._idle_interval = config.idle_interval
+        self._active_interval = config.active_interval
+        self._change_threshold = config.change_threshold
+        self._closed_position = config.closed_position
+        self._open_position = config.open_position
+        self._transition_threshold = config.transition_threshold
+        self._state_timeout = config.state_timeout
+        self._update_classifier()
+
+    def _update_classifier(self):
+        """Rebuild the door state classifier for the current thresholds."""
+        self._classify = _make_classifier(
+            self._open_position,
+            self._closed_position,
+            self._transition_threshold,
+            self._change_threshold
+        )
+
+    def _update_color_bounds(self):
+        """Cache the color range as uint8 arrays for the pixel compare."""
+        self._min_color_arr = np.clip(self._min_color, 0, 255).astype(np.uint8)
+        self._max_color_arr = np.clip(self._max_color, 0, 255).astype(np.uint8)
+        if (
+            max(self._min_color) > 255
+            or min(self._max_color) < 0
+            or np.any(self._min_color_arr > self._max_color_arr)
+        ):
+            # Empty range on some channel (inverted, or entirely outside
+            # 0-255 before clamping), nothing can match
+            self._color_span = None
+        else:
+            self._color_span = self._max_color_arr - self._min_color_arr
+
+    def _measurement_inputs(self) -> tuple:
+        """Return the settings that determine the measured percentage."""
+        return (
+            self._camera_entity,
+            self._point_a,
+            self._point_b,
+            self._min_color,
+            self._max_color
+        )
 
     async def _handle_config_update(self, hass: HomeAssistant, config_entry: ConfigEntry):
         """Handle configuration update."""
+        old_inputs = self._measurement_inputs()
+        old_intervals = (self._idle_interval, self._active_interval)
+
         # Update all config parameters
         self._update_config_from_entry()
         
-        # Cancel any existing updates
-        if self._unsub_update:
-            self._unsub_update()
-            self._unsub_update = None
-        
-        # Reset state to force recalculation
-        self._door_state = STATE_UNKNOWN
-        self._percent_value = None
-        self._last_percent = None
-        
-        # Force immediate update with new settings
-        await self.async_refresh()
-        self._schedule_update()
+        if self._measurement_inputs() != old_inputs:
+            # Cancel any existing updates
+            if self._unsub_update:
+                self._unsub_update()
+                self._unsub_update = None
+            
+            # Reset state to force recalculation
+            self._door_state = STATE_UNKNOWN
+            self._percent_value = None
+            self._last_percent = None
+            
+            # Force immediate update with new settings
+            await self.async_refresh()
+            self._schedule_update()
+            return
+
+        # Same measurement: reclassify the current reading with the new
+        # thresholds instead of fetching and decoding a new frame
+        if self._percent_value is not None:
+            old_state = self._door_state
+            self._update_door_state()
+            self._async_write_state_throttled(
+                fire_event=self._door_state != old_state, force=True
+            )
+        if (self._idle_interval, self._active_interval) != old_intervals:
+            self._schedule_update()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
         await super().async_added_to_hass()
         
-        # Exclude from recorder
-        async_dispatcher_send(
-            self.hass,
-            "exclude_entity_from_recorder",
-            self.entity_id,
-            True
-        )
-        
         # Restore previous state if available
         if (state := await self.async_get_last_state()):
             try:
@@ -163,7 +324,7 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
                     state.attributes.get('last_update', dt_util.utcnow().isoformat())
                 )
                 self._available = True
-                self.async_write_ha_state()  # Immediately update state
+                self._async_write_state_throttled()  # Immediately update state
             except (ValueError, TypeError, AttributeError) as e:
                 _LOGGER.warning("Invalid stored state: %s - %s", state.state, str(e))
         
@@ -181,6 +342,60 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
         if self._unsub_update:
             self._unsub_update()
             self._unsub_update = None
+        if self._unsub_state_write:
+            self._unsub_state_write()
+            self._unsub_state_write = None
+
+    @callback
+    def _async_write_state_throttled(self, fire_event: bool = False, force: bool = False):
+        """Write the HA state, coalescing writes that come too close together.
+
+        The update event, if requested, is fired with the write so listeners
+        never see it ahead of the state it describes. Forced writes are
+        never deferred.
+        """
+        self._pending_event |= fire_event
+        if self._unsub_state_write:
+            if not force:
+                # A pending write will pick up the latest state
+                return
+            self._unsub_state_write()
+            self._unsub_state_write = None
+        delay = self._last_state_write + _MIN_STATE_WRITE_INTERVAL - time.monotonic()
+        if delay > 0 and not force:
+            self._unsub_state_write = async_call_later(
+                self._hass, delay, self._async_write_pending_state
+            )
+            return
+        self._async_write_state_now()
+
+    @callback
+    def _async_write_pending_state(self, _now):
+        """Flush a state write deferred by the throttle."""
+        self._unsub_state_write = None
+        self._async_write_state_now()
+
+    @callback
+    def _async_write_state_now(self):
+        """Write the HA state and fire the update event if one is pending."""
+        # Take the pending event first, so a failed write can't leave it
+        # behind for an unrelated later write
+        fire_event = self._pending_event
+        self._pending_event = False
+        self._last_state_write = time.monotonic()
+        self.async_write_ha_state()
+        if not fire_event:
+            return
+        self._hass.bus.async_fire(
+            EVENT_DOOR_STATUS_UPDATED,
+            {
+                "percent": self._percent_value,
+                "state": self._door_state,
+                "next_action": self._next_action,
+                "entity_id": self.entity_id,
+                "camera_entity": self._camera_entity
+            }
+        )
 
     def _schedule_update(self):
         """Schedule the next update."""
@@ -209,118 +424,101 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
                 _LOGGER.warning("Camera entity %s is unavailable", self._camera_entity)
                 return
 
-            # Get camera image with timeout
-            image = await asyncio.wait_for(
-                async_get_image(self._hass, self._camera_entity),
-                timeout=10.0
+            # Get camera image, shared with other sensors on the same camera;
+            # forced refreshes always fetch a fresh frame
+            image = await _async_get_shared_image(
+                self._hass,
+                self._camera_entity,
+                0 if force_update else min(self._active_interval, self._idle_interval) / 2
             )
             
             if not image or not image.content:
                 _LOGGER.warning("No image data received from camera %s", self._camera_entity)
                 return
 
-            # Convert to PIL Image
-            img_data = io.BytesIO(image.content)
-            try:
-                with Image.open(img_data) as img:
-                    img_array = np.array(img.convert('RGB'))
-            except Exception as e:
-                _LOGGER.error("Error converting image: %s", str(e))
-                return
-
-            # Validate image array
-            if not isinstance(img_array, np.ndarray) or len(img_array.shape) != 3:
-                _LOGGER.error("Invalid image array format")
-                return
-
-            # Get pixels along the line
-            try:
-                pixels = self._get_line_pixels(img_array, self._point_a, self._point_b)
-                if len(pixels) == 0:
-                    _LOGGER.warning("No pixels found along the specified line")
+            # Cameras often serve the same frame between motion events; only
+            # decode when the bytes or the measuring parameters changed
+            frame_key = (self._point_a, self._point_b, self._min_color, self._max_color)
+            last_frame = self._last_frame
+            if (
+                last_frame is not None
+                and last_frame[1] == frame_key
+                and last_frame[0] == image.content
+            ):
+                current_percent = last_frame[2]
+            else:
+                # Decode and measure off the event loop
+                current_percent = await self._hass.async_add_executor_job(
+                    self._measure_frame,
+                    image.content,
+                    self._point_a,
+                    self._point_b,
+                    self._min_color_arr,
+                    self._color_span
+                )
+                if current_percent is None:
                     return
-            except Exception as e:
-                _LOGGER.error("Error getting line pixels: %s", str(e))
-                return
+                self._last_frame = (image.content, frame_key, current_percent)
 
-            # Calculate match percentage with the color range
-            try:
-                in_range = np.all(
-                    (pixels >= self._min_color) & (pixels <= self._max_color),
-                    axis=1
-                )
-                match_percent = (np.sum(in_range) / len(pixels)) * 100
-                current_percent = round(float(match_percent), 1)
-                
-                # Store in history (limited length)
-                self._state_history.append(current_percent)
-                if len(self._state_history) > self._max_history_length:
-                    self._state_history.pop(0)
-                
-                # Determine if we should switch to active mode
-                if self._last_percent is not None:
-                    change = abs(current_percent - self._last_percent)
-                    if change >= self._change_threshold:
-                        if not self._active_mode:
-                            self._active_mode = True
-                            self._schedule_update()
-                            _LOGGER.debug("Switched to active mode due to change: %.1f%%", change)
-                    elif self._active_mode:
-                        self._active_mode = False
+            # Update history and door state
+            now_dt = dt_util.utcnow()
+            
+            # Store in history (deque drops the oldest entry when full)
+            self._state_history.append(current_percent)
+            
+            # Determine if we should switch to active mode
+            if self._last_percent is not None:
+                change = abs(current_percent - self._last_percent)
+                if change >= self._change_threshold:
+                    if not self._active_mode:
+                        self._active_mode = True
                         self._schedule_update()
-                        _LOGGER.debug("Switched back to idle mode")
-                
-                # Update states
-                self._last_percent = self._percent_value
-                self._percent_value = current_percent
-                self._last_update_time = dt_util.utcnow()
-                self._available = True
-                
-                # Determine if we should update HA state
-                state_changed = False
-                if force_update or self._door_state == STATE_UNKNOWN or self._percent_value is None:
-                    state_changed = True
+                        _LOGGER.debug("Switched to active mode due to change: %.1f%%", change)
+                elif self._active_mode:
+                    self._active_mode = False
+                    self._schedule_update()
+                    _LOGGER.debug("Switched back to idle mode")
+            
+            # Update states
+            self._last_percent = self._percent_value
+            self._percent_value = current_percent
+            self._last_update_time = now_dt
+            self._available = True
+            
+            # Determine if we should update HA state
+            state_changed = False
+            if force_update or self._door_state == STATE_UNKNOWN or self._percent_value is None:
+                state_changed = True
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Forcing state calculation due to %s", 
                                  "initial run" if self._percent_value is None else "forced update")
-                else:
-                    change = abs(current_percent - (self._last_percent or current_percent))
-                    time_since_last_change = (dt_util.utcnow() - self._state_stable_since).total_seconds()
-                    
-                    if change >= self._transition_threshold or time_since_last_change > self._state_timeout:
-                        state_changed = True
+            else:
+                # Only look at the clock when the change alone isn't enough
+                change = abs(current_percent - (self._last_percent or current_percent))
+                state_changed = (
+                    change >= self._transition_threshold
+                    or (now_dt - self._state_stable_since).total_seconds() > self._state_timeout
+                )
+            
+            if state_changed:
+                old_state = self._door_state
+                self._update_door_state()
+                self._state_stable_since = now_dt
                 
-                if state_changed:
-                    old_state = self._door_state
-                    self._update_door_state()
-                    self._state_stable_since = dt_util.utcnow()
-                    
-                    if force_update or self._door_state != old_state:
-                        self.async_write_ha_state()
-                        
-                        self._hass.bus.fire(
-                            EVENT_DOOR_STATUS_UPDATED,
-                            {
-                                "percent": self._percent_value,
-                                "state": self._door_state,
-                                "next_action": self._next_action,
-                                "entity_id": self.entity_id,
-                                "camera_entity": self._camera_entity
-                            }
-                        )
-                    
+                if force_update or self._door_state != old_state:
+                    self._async_write_state_throttled(fire_event=True, force=force_update)
+                
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("State %s: %.1f%%, Door state: %s, Next action: %s", 
                                  "forced" if force_update else "changed",
                                  current_percent, self._door_state, self._next_action)
-                else:
-                    _LOGGER.debug("State unchanged: %.1f%% (last: %.1f%%)", 
-                                 current_percent, self._last_percent or current_percent)
-                
-            except Exception as e:
-                _LOGGER.error("Error calculating match percentage: %s", str(e))
-                return
+            elif _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("State unchanged: %.1f%% (last: %.1f%%)", 
+                             current_percent, self._last_percent or current_percent)
 
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Timeout getting image from camera %s", self._camera_entity)
+        except HomeAssistantError as e:
+            # Raised by the camera component on timeout or when no image is available
+            _LOGGER.warning("Error getting image from camera %s: %s", self._camera_entity, str(e))
         except Exception as e:
             _LOGGER.error("Error in async_update: %s", str(e), exc_info=True)
 
@@ -334,106 +532,49 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
         if self._last_percent is None:
             self._last_percent = self._percent_value
         
-        change = self._percent_value - (self._last_percent or self._percent_value)
-        moving = abs(change) >= self._change_threshold
-        
-        if self._percent_value <= self._open_position + self._transition_threshold:
-            self._door_state = STATE_OPEN
-            self._next_action = NEXT_ACTION_CLOSE
-        elif self._percent_value >= self._closed_position - self._transition_threshold:
-            self._door_state = STATE_CLOSED
-            self._next_action = NEXT_ACTION_OPEN
-        elif moving:
-            if change > 0:
-                self._door_state = STATE_CLOSING
-                self._next_action = NEXT_ACTION_OPEN
-            else:
-                self._door_state = STATE_OPENING
-                self._next_action = NEXT_ACTION_CLOSE
-        elif self._percent_value > self._open_position + self._transition_threshold:
-            self._door_state = STATE_PARTIALLY_OPEN
-            if self._door_state == STATE_OPENING:
-                self._next_action = NEXT_ACTION_CLOSE
-            elif self._door_state == STATE_CLOSING:
-                self._next_action = NEXT_ACTION_OPEN
-            else:
-                if self._percent_value > (self._closed_position + self._open_position) / 2:
-                    self._next_action = NEXT_ACTION_OPEN
-                else:
-                    self._next_action = NEXT_ACTION_CLOSE
-        else:
-            self._door_state = STATE_UNKNOWN
-            self._next_action = NEXT_ACTION_UNKNOWN
+        self._door_state, self._next_action = self._classify(
+            self._percent_value, self._last_percent
+        )
 
-    def _parse_coordinates(self, coord_str: str) -> tuple[int, int]:
-        """Parse coordinates from string 'x,y' to tuple (x,y)."""
+    def _measure_frame(
+        self,
+        content: bytes,
+        point_a: tuple[int, int],
+        point_b: tuple[int, int],
+        lower: np.ndarray,
+        span: np.ndarray | None
+    ) -> float | None:
+        """Return the percentage of line pixels in the color range.
+
+        Runs in the executor. Returns None if the frame can't be measured.
+        """
+        # Decode the frame and extract just the line as a strip
+        img_data = io.BytesIO(content)
         try:
-            x, y = map(int, coord_str.split(','))
-            return (x, y)
-        except ValueError as e:
-            _LOGGER.error("Invalid coordinates format: %s", coord_str)
-            raise ValueError(f"Invalid coordinates format: {coord_str}") from e
-
-    def _parse_color(self, color_str: str) -> tuple[int, int, int]:
-        """Parse color from string 'R,G,B' to tuple (R,G,B)."""
-        try:
-            r, g, b = map(int, color_str.split(','))
-            return (r, g, b)
-        except ValueError as e:
-            _LOGGER.error("Invalid color format: %s", color_str)
-            raise ValueError(f"Invalid color format: {color_str}") from e
-
-    def _get_line_pixels(self, img_array: np.ndarray, point_a: tuple[int, int], point_b: tuple[int, int]) -> np.ndarray:
-        """Get pixels along a line using Bresenham's algorithm."""
-        try:
-            height, width = img_array.shape[:2]
-            if height == 0 or width == 0:
-                _LOGGER.error("Empty image array")
-                return np.array([])
-                
-            x0, y0 = point_a
-            x1, y1 = point_b
-            pixels = []
-
-            x0 = max(0, min(x0, width - 1))
-            y0 = max(0, min(y0, height - 1))
-            x1 = max(0, min(x1, width - 1))
-            y1 = max(0, min(y1, height - 1))
-
-            dx = abs(x1 - x0)
-            dy = abs(y1 - y0)
-            x, y = x0, y0
-            sx = -1 if x0 > x1 else 1
-            sy = -1 if y0 > y1 else 1
-
-            if dx > dy:
-                err = dx / 2.0
-                while x != x1:
-                    if 0 <= y < height and 0 <= x < width:
-                        pixels.append(img_array[y, x])
-                    err -= dy
-                    if err < 0:
-                        y += sy
-                        err += dx
-                    x += sx
-            else:
-                err = dy / 2.0
-                while y != y1:
-                    if 0 <= y < height and 0 <= x < width:
-                        pixels.append(img_array[y, x])
-                    err -= dx
-                    if err < 0:
-                        x += sx
-                        err += dy
-                    y += sy
-
-            if 0 <= y < height and 0 <= x < width:
-                pixels.append(img_array[y, x])
-
-            return np.array(pixels)
+            with Image.open(img_data) as img:
+                # Let the JPEG decoder emit RGB directly where it can
+                img.draft('RGB', img.size)
+                # Keyed on the endpoints too, so a config change made while
+                # this runs can't leave stale geometry behind
+                key = (point_a, point_b, img.size)
+                geometry = self._line_geometry
+                if geometry is None or geometry[0] != key:
+                    geometry = (key, _line_sampler(point_a, point_b, *img.size))
+                    self._line_geometry = geometry
+                line = geometry[1](img)
+                if line.mode != 'RGB':
+                    line = line.convert('RGB')
         except Exception as e:
-            _LOGGER.error("Error in line pixel calculation: %s", str(e))
-            return np.array([])
+            _LOGGER.error("Error converting image: %s", str(e))
+            return None
+
+        # Get pixels along the line; the range compare relies on uint8 wraparound
+        pixels = np.ascontiguousarray(np.asarray(line), dtype=np.uint8).reshape(-1, 3)
+
+        # Calculate match percentage with the color range
+        matches = _count_in_range(pixels, lower, span)
+        match_percent = (matches / len(pixels)) * 100
+        return round(float(match_percent), 1)
 
     @property
     def state(self) -> str:
@@ -464,31 +605,3 @@ class DoorStatusSensor(SensorEntity, RestoreEntity):
     def available(self) -> bool:
         """Return True if entity is available."""
         return self._available
-
-    async def async_update_config(self, new_config: dict) -> None:
-        """Update the sensor configuration."""
-        if CONF_POINT_A in new_config:
-            self._point_a = self._parse_coordinates(new_config[CONF_POINT_A])
-        if CONF_POINT_B in new_config:
-            self._point_b = self._parse_coordinates(new_config[CONF_POINT_B])
-        if CONF_MIN_COLOR in new_config:
-            self._min_color = self._parse_color(new_config[CONF_MIN_COLOR])
-        if CONF_MAX_COLOR in new_config:
-            self._max_color = self._parse_color(new_config[CONF_MAX_COLOR])
-        if CONF_IDLE_INTERVAL in new_config:
-            self._idle_interval = new_config[CONF_IDLE_INTERVAL]
-        if CONF_ACTIVE_INTERVAL in new_config:
-            self._active_interval = new_config[CONF_ACTIVE_INTERVAL]
-        if CONF_CHANGE_THRESHOLD in new_config:
-            self._change_threshold = new_config[CONF_CHANGE_THRESHOLD]
-        if CONF_CLOSED_POSITION in new_config:
-            self._closed_position = new_config[CONF_CLOSED_POSITION]
-        if CONF_OPEN_POSITION in new_config:
-            self._open_position = new_config[CONF_OPEN_POSITION]
-        if CONF_TRANSITION_THRESHOLD in new_config:
-            self._transition_threshold = new_config[CONF_TRANSITION_THRESHOLD]
-        if CONF_STATE_TIMEOUT in new_config:
-            self._state_timeout = new_config[CONF_STATE_TIMEOUT]
-        
-        self._schedule_update()
-        await self.async_refresh()
\ No newline at end of file